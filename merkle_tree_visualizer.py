@@ -1,33 +1,105 @@
 import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 
+# Pair hashes within one layer are independent, so large layers can be fanned
+# out to worker processes. Threads would not help: each pair is a 64-byte
+# message and hashlib only releases the GIL for buffers of 2048+ bytes. The
+# threshold is set where the parallel path measurably beats serial on a
+# shared pool; below it, fork and chunk-pickling overhead dominate the ~1µs
+# a pair hash costs.
+_PARALLEL_MIN_PAIRS = 1 << 18
 
-def hash_pair(a: str, b: str) -> str:
-    """Hash two hexadecimal strings together using SHA-256."""
-    return hashlib.sha256((a + b).encode("utf-8")).hexdigest()
-
-
-def build_merkle_tree(leaves: list[str]) -> list[list[str]]:
-    """Build a Merkle tree from a list of leaf hashes and return all layers."""
-    tree = [list(leaves)]
-    while len(tree[-1]) > 1:
-        layer: list[str] = []
-        current_layer = tree[-1].copy()
-        # if odd number of nodes, duplicate last hash
-        if len(current_layer) % 2 == 1:
-            current_layer.append(current_layer[-1])
-        for i in range(0, len(current_layer), 2):
-            combined = hash_pair(current_layer[i], current_layer[i + 1])
-            layer.append(combined)
-        tree.append(layer)
+
+def _hash_pairs(buf: bytes) -> bytes:
+    """Hash consecutive 64-byte pairs from a packed layer chunk."""
+    sha256 = hashlib.sha256
+    return b"".join(sha256(buf[i:i + 64]).digest() for i in range(0, len(buf), 64))
+
+
+def _hash_layer_parallel(buf: bytes, pool: ProcessPoolExecutor, workers: int) -> bytes:
+    """Hash a packed even-length layer across worker processes."""
+    chunk = -(-(len(buf) // 64) // workers) * 64
+    return b"".join(pool.map(_hash_pairs, (buf[i:i + chunk] for i in range(0, len(buf), chunk))))
+
+
+def hash_pair(a: bytes, b: bytes) -> bytes:
+    """Hash two raw digests together using SHA-256."""
+    return hashlib.sha256(a + b).digest()
+
+
+def _next_layer(buf: bytes, pool: ProcessPoolExecutor | None = None,
+                workers: int = 1) -> bytes:
+    """Hash one packed layer into its parent layer."""
+    # hashlib's sha256 is OpenSSL-backed (SHA-NI where available); the cost
+    # that remains per pair is Python call overhead, so keep the inner loop
+    # free of extra function calls and attribute lookups.
+    sha256 = hashlib.sha256
+    n = len(buf) // 32
+    even_end = (n - n % 2) * 32
+    if pool is not None and even_end >= 64 * _PARALLEL_MIN_PAIRS:
+        layer = _hash_layer_parallel(buf[:even_end], pool, workers)
+    else:
+        layer = b"".join(
+            sha256(buf[i:i + 64]).digest() for i in range(0, even_end, 64)
+        )
+    if n % 2:
+        # odd node count: pair the last node with itself directly instead
+        # of building a padded copy of the whole layer
+        layer += sha256(buf[even_end:] + buf[even_end:]).digest()
+    return layer
+
+
+def _iter_layers(buf: bytes):
+    """Yield each parent layer above ``buf``, up to and including the root.
+
+    One process pool is shared by every layer large enough to go parallel,
+    so pool start-up is paid at most once per tree, and only on hosts with
+    more than one CPU.
+    """
+    workers = os.cpu_count() or 1
+    pool = None
+    try:
+        while len(buf) > 32:
+            if pool is None and workers > 1 and len(buf) >= 64 * _PARALLEL_MIN_PAIRS:
+                pool = ProcessPoolExecutor(max_workers=workers)
+            buf = _next_layer(buf, pool, workers)
+            yield buf
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def build_merkle_tree(leaves: list[bytes]) -> list[bytes]:
+    """Build a Merkle tree from a list of leaf hashes and return all layers.
+
+    Each layer is one contiguous bytes buffer of packed 32-byte nodes
+    (leaves first, root last): adjacent pairs sit in adjacent memory, and a
+    pair hash is a single 64-byte slice instead of two objects concatenated.
+    """
+    tree = [b"".join(leaves)]
+    tree.extend(_iter_layers(tree[0]))
     return tree
 
 
-def print_merkle_tree(tree: list[list[str]]) -> None:
+def merkle_root(leaves: list[bytes]) -> bytes:
+    """Compute only the Merkle root with a rolling buffer.
+
+    Unlike build_merkle_tree, which retains every layer for visualization,
+    this keeps a single layer alive at a time: O(n) total memory.
+    """
+    buf = b"".join(leaves)
+    for buf in _iter_layers(buf):
+        pass
+    return buf
+
+
+def print_merkle_tree(tree: list[bytes]) -> None:
     """Pretty‑print a Merkle tree (truncating hashes for readability)."""
     # Print from root (last element) to leaves (first element)
     for depth, layer in enumerate(reversed(tree)):
         indent = "    " * depth
-        shortened = [h[:8] for h in layer]
+        shortened = [layer[i:i + 4].hex() for i in range(0, len(layer), 32)]
         print(indent + "   ".join(shortened))
 
 
@@ -40,11 +112,11 @@ def main() -> None:
         return
     items = [v.strip() for v in data.split(",") if v.strip()]
     # Hash each item to create leaves
-    leaves = [hashlib.sha256(item.encode("utf-8")).hexdigest() for item in items]
+    leaves = [hashlib.sha256(item.encode("utf-8")).digest() for item in items]
     tree = build_merkle_tree(leaves)
     print("\nMerkle Tree (root at top, leaves at bottom):")
     print_merkle_tree(tree)
-    print("\nMerkle Root:", tree[-1][0])
+    print("\nMerkle Root:", tree[-1].hex())
 
 
 if __name__ == "__main__":